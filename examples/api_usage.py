@@ -1,32 +1,59 @@
 #!/usr/bin/env python
 """
 Example script demonstrating how to interact with the CrewAI Flow API.
+
+All HTTP calls share a single `httpx.AsyncClient`, so the whole script reuses
+one pooled keep-alive connection instead of opening a new one per request.
+Completion is awaited over a WebSocket, which receives a single message.
 """
+import asyncio
+import json
 import time
-import requests
+import httpx
+import websockets
 from typing import Optional
 
 
 API_BASE_URL = "http://127.0.0.1:8000"
+WS_BASE_URL = API_BASE_URL.replace("http", "ws", 1)
+
+# Connection pool for the shared client: a few idle keep-alive sockets are
+# enough for this script (an open status stream holds one of them while the
+# other calls run on the rest)
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=10)
 
 
-def trigger_poem_flow(sentence_count: Optional[int] = None) -> str:
+async def check_health(client: httpx.AsyncClient):
+    """
+    Check that the API server is up.
+    
+    Args:
+        client: Shared HTTP client
+    """
+    response = await client.get("/health")
+    response.raise_for_status()
+    print("   ✓ API is healthy")
+
+
+async def trigger_poem_flow(
+    client: httpx.AsyncClient,
+    sentence_count: Optional[int] = None
+) -> str:
     """
     Trigger a poem flow execution.
     
     Args:
+        client: Shared HTTP client
         sentence_count: Optional number of sentences (1-10)
         
     Returns:
         Execution ID
     """
-    url = f"{API_BASE_URL}/api/v1/poem-flow/execute"
-    
     payload = {}
     if sentence_count is not None:
         payload["sentence_count"] = sentence_count
     
-    response = requests.post(url, json=payload)
+    response = await client.post("/api/v1/poem-flow/execute", json=payload)
     response.raise_for_status()
     
     data = response.json()
@@ -39,74 +66,184 @@ def trigger_poem_flow(sentence_count: Optional[int] = None) -> str:
     return execution_id
 
 
-def get_execution_status(execution_id: str) -> dict:
+async def get_execution_status(client: httpx.AsyncClient, execution_id: str) -> dict:
     """
     Get the status of a flow execution.
     
     Args:
+        client: Shared HTTP client
         execution_id: The execution ID
         
     Returns:
         Execution status data
     """
-    url = f"{API_BASE_URL}/api/v1/poem-flow/execution/{execution_id}"
-    
-    response = requests.get(url)
+    response = await client.get(f"/api/v1/poem-flow/execution/{execution_id}")
     response.raise_for_status()
     
     return response.json()
 
 
-def wait_for_completion(execution_id: str, max_wait: int = 300, poll_interval: int = 2) -> dict:
+async def watch_for_completion(execution_id: str, max_wait: int = 300) -> dict:
+    """
+    Wait for a flow execution to complete over a WebSocket.
+    
+    The server sends one message with the final status when the execution
+    completes or fails, so nothing is exchanged while it runs.
+    
+    Args:
+        execution_id: The execution ID
+        max_wait: Maximum time to wait in seconds
+        
+    Returns:
+        Final execution status data
+    """
+    print(f"\n⏳ Waiting for execution {execution_id} to complete...")
+    
+    url = f"{WS_BASE_URL}/api/v1/poem-flow/ws/{execution_id}"
+    async with websockets.connect(url) as websocket:
+        status_data = json.loads(await asyncio.wait_for(websocket.recv(), max_wait))
+    
+    if status_data["status"] == "completed":
+        print("✓ Execution completed successfully!")
+    else:
+        print(f"✗ Execution failed: {status_data.get('error', 'Unknown error')}")
+    return status_data
+
+
+async def wait_for_completion(
+    client: httpx.AsyncClient,
+    execution_id: str,
+    max_wait: int = 300
+) -> dict:
     """
-    Wait for a flow execution to complete.
+    Wait for a flow execution to complete, reporting each status change.
+    
+    Subscribes to the execution's Server-Sent Events stream, so every status
+    change arrives as soon as it happens over a single connection. Use this
+    instead of `watch_for_completion` to follow progress.
     
     Args:
+        client: Shared HTTP client
         execution_id: The execution ID
         max_wait: Maximum time to wait in seconds
-        poll_interval: Time between status checks in seconds
         
     Returns:
         Final execution status data
     """
     print(f"\n⏳ Waiting for execution {execution_id} to complete...")
     
-    elapsed = 0
-    while elapsed < max_wait:
-        status_data = get_execution_status(execution_id)
-        status = status_data["status"]
+    url = f"/api/v1/poem-flow/execution/{execution_id}/stream"
+    start = time.monotonic()
+    
+    # The server sends a keepalive comment at least every 15 seconds,
+    # so a longer read timeout only trips on a dead connection
+    async with client.stream("GET", url, timeout=httpx.Timeout(5, read=30)) as response:
+        response.raise_for_status()
+        
+        async for line in response.aiter_lines():
+            elapsed = int(time.monotonic() - start)
+            if elapsed >= max_wait:
+                break
+            if not line.startswith("data:"):
+                continue
+            
+            status_data = json.loads(line[len("data:"):])
+            status = status_data["status"]
+            
+            print(f"  [{elapsed}s] Status: {status}")
+            
+            if status == "completed":
+                print("✓ Execution completed successfully!")
+                return status_data
+            elif status == "failed":
+                print(f"✗ Execution failed: {status_data.get('error', 'Unknown error')}")
+                return status_data
+    
+    print(f"⚠ Timeout: Execution did not complete within {max_wait} seconds")
+    return await get_execution_status(client, execution_id)
+
+
+async def poll_for_completion(
+    client: httpx.AsyncClient,
+    execution_id: str,
+    max_wait: int = 300,
+    initial_interval: float = 0.5,
+    max_interval: float = 10.0
+) -> dict:
+    """
+    Wait for a flow execution to complete by polling its status.
+    
+    Fallback for environments where the event stream used by
+    `wait_for_completion` is unavailable (e.g. a proxy that buffers
+    responses). The poll interval grows by 1.5x up to `max_interval`, and
+    each poll sends the last ETag so unchanged statuses come back as an
+    empty `304 Not Modified`.
+    
+    Args:
+        client: Shared HTTP client
+        execution_id: The execution ID
+        max_wait: Maximum time to wait in seconds
+        initial_interval: First delay between status checks in seconds
+        max_interval: Upper bound for the delay between status checks
         
-        print(f"  [{elapsed}s] Status: {status}")
+    Returns:
+        Final execution status data
+    """
+    print(f"\n⏳ Polling execution {execution_id} until it completes...")
+    
+    url = f"/api/v1/poem-flow/execution/{execution_id}"
+    start = time.monotonic()
+    interval = initial_interval
+    status_data = None
+    etag = None
+    
+    while time.monotonic() - start < max_wait:
+        headers = {"If-None-Match": etag} if etag else {}
+        response = await client.get(url, headers=headers)
         
-        if status == "completed":
-            print("✓ Execution completed successfully!")
-            return status_data
-        elif status == "failed":
-            print(f"✗ Execution failed: {status_data.get('error', 'Unknown error')}")
-            return status_data
+        if response.status_code != 304:
+            response.raise_for_status()
+            status_data = response.json()
+            etag = response.headers.get("ETag")
+            status = status_data["status"]
+            
+            print(f"  [{int(time.monotonic() - start)}s] Status: {status}")
+            
+            if status == "completed":
+                print("✓ Execution completed successfully!")
+                return status_data
+            elif status == "failed":
+                print(f"✗ Execution failed: {status_data.get('error', 'Unknown error')}")
+                return status_data
         
-        time.sleep(poll_interval)
-        elapsed += poll_interval
+        await asyncio.sleep(interval)
+        interval = min(interval * 1.5, max_interval)
     
     print(f"⚠ Timeout: Execution did not complete within {max_wait} seconds")
-    return get_execution_status(execution_id)
+    return status_data or await get_execution_status(client, execution_id)
 
 
-def list_executions(status: Optional[str] = None, limit: int = 10):
+async def list_executions(
+    client: httpx.AsyncClient,
+    status: Optional[str] = None,
+    limit: int = 10
+):
     """
-    List flow executions.
+    List poem flow executions.
+    
+    The list endpoint returns summaries with a short result preview; fetch
+    an execution by ID for its full result.
     
     Args:
+        client: Shared HTTP client
         status: Filter by status (pending, running, completed, failed)
         limit: Maximum number of results
     """
-    url = f"{API_BASE_URL}/api/v1/poem-flow/executions"
-    
-    params = {"limit": limit}
+    params = {"flow_name": "poem_flow", "limit": limit}
     if status:
         params["status"] = status
     
-    response = requests.get(url, params=params)
+    response = await client.get("/api/v1/executions", params=params)
     response.raise_for_status()
     
     executions = response.json()
@@ -116,59 +253,55 @@ def list_executions(status: Optional[str] = None, limit: int = 10):
         print(f"\n  ID: {exec_data['execution_id']}")
         print(f"  Status: {exec_data['status']}")
         print(f"  Created: {exec_data['created_at']}")
-        if exec_data.get('result'):
-            result = exec_data['result']
-            print(f"  Sentences: {result.get('sentence_count')}")
-            poem = result.get('poem', '')
-            preview = poem[:100] + "..." if len(poem) > 100 else poem
-            print(f"  Poem: {preview}")
+        if exec_data.get('result_preview'):
+            print(f"  Poem: {exec_data['result_preview']}")
 
 
-def main():
+async def main():
     """Main example workflow."""
     print("=" * 60)
     print("CrewAI Flow API Example")
     print("=" * 60)
     
     try:
-        # 1. Check API health
-        print("\n1. Checking API health...")
-        response = requests.get(f"{API_BASE_URL}/health")
-        response.raise_for_status()
-        print("   ✓ API is healthy")
-        
-        # 2. Trigger a flow execution
-        print("\n2. Triggering poem flow execution...")
-        execution_id = trigger_poem_flow(sentence_count=3)
-        
-        # 3. Wait for completion
-        print("\n3. Waiting for completion...")
-        result = wait_for_completion(execution_id, max_wait=120)
-        
-        # 4. Display results
-        if result["status"] == "completed" and result.get("result"):
-            print("\n4. Results:")
-            print(f"   Sentence Count: {result['result']['sentence_count']}")
-            print(f"   Poem:\n{'-' * 60}")
-            print(result['result']['poem'])
-            print('-' * 60)
-        
-        # 5. List all executions
-        print("\n5. Listing recent executions...")
-        list_executions(limit=5)
+        async with httpx.AsyncClient(base_url=API_BASE_URL, limits=CLIENT_LIMITS) as client:
+            # 1-2. Check API health and trigger a flow execution concurrently
+            print("\n1. Checking API health and triggering poem flow execution...")
+            _, execution_id = await asyncio.gather(
+                check_health(client),
+                trigger_poem_flow(client, sentence_count=3)
+            )
+            
+            # 3. Wait for completion
+            print("\n3. Waiting for completion...")
+            result = await watch_for_completion(execution_id, max_wait=120)
+            
+            # 4. Display results
+            if result["status"] == "completed" and result.get("result"):
+                print("\n4. Results:")
+                print(f"   Sentence Count: {result['result']['sentence_count']}")
+                print(f"   Poem:\n{'-' * 60}")
+                print(result['result']['poem'])
+                print('-' * 60)
+            
+            # 5. List all executions
+            print("\n5. Listing recent executions...")
+            await list_executions(client, limit=5)
         
         print("\n" + "=" * 60)
         print("✓ Example completed successfully!")
         print("=" * 60)
         
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("\n✗ Error: Could not connect to API server")
         print("  Make sure the server is running: python run_api.py")
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         print(f"\n✗ HTTP Error: {e}")
+    except asyncio.TimeoutError:
+        print("\n✗ Error: Execution did not complete in time")
     except Exception as e:
         print(f"\n✗ Error: {e}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
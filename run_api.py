@@ -4,11 +4,12 @@ API server runner for CrewAI flows.
 Starts the FastAPI server with proper Python path setup and environment loading.
 
 Usage:
-    python run_api.py [--host HOST] [--port PORT] [--reload]
+    python run_api.py [--host HOST] [--port PORT] [--workers N] [--reload]
     
 Examples:
     python run_api.py
     python run_api.py --host 0.0.0.0 --port 8000
+    python run_api.py --workers 4  # Requires REDIS_URL (shared execution store)
     python run_api.py --reload  # Enable auto-reload for development
 """
 
@@ -56,9 +57,35 @@ def main():
         action="store_true",
         help="Enable auto-reload for development"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of server processes (default: CPU count with REDIS_URL, else 1)"
+    )
     
     args = parser.parse_args()
     
+    # Server processes only share executions through Redis; with the
+    # in-memory store each one would see a different set of executions
+    shared_store = bool(os.getenv("REDIS_URL"))
+    if args.workers is None:
+        args.workers = (os.cpu_count() or 1) if shared_store else 1
+    if args.workers > 1 and not shared_store:
+        print("⚠ Warning: --workers > 1 requires REDIS_URL for a shared execution store.")
+        print("   Falling back to a single worker.")
+        args.workers = 1
+    if args.workers > 1 and args.reload:
+        print("⚠ Warning: --reload runs a single worker; ignoring --workers.")
+        args.workers = 1
+    
+    # Every server process runs its own flow pool; split the CPUs between
+    # them so N server processes don't each start a full pool of flow workers
+    flow_workers = os.environ.setdefault(
+        "POEM_FLOW_MAX_WORKERS",
+        str(max(1, (os.cpu_count() or 1) // args.workers))
+    )
+    
     try:
         import uvicorn
     except ImportError:
@@ -69,18 +96,23 @@ def main():
     print(f"\n🚀 Starting CrewAI Flow API server...")
     print(f"   Host: {args.host}")
     print(f"   Port: {args.port}")
+    print(f"   Workers: {args.workers} (poem flow workers per process: {flow_workers})")
     print(f"   Reload: {args.reload}")
     print(f"\n📖 API Documentation will be available at:")
     print(f"   http://{args.host}:{args.port}/docs")
     print(f"   http://{args.host}:{args.port}/redoc")
     print()
     
-    # Run the server
+    # Run the server on uvloop (not available on Windows) with the
+    # httptools parser, both faster than the asyncio/h11 defaults
     uvicorn.run(
         "api.app:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=args.workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
 
@@ -12,8 +12,10 @@ Examples:
     python run_flow.py poem_flow plot
 """
 
+import importlib
+import inspect
 import sys
-import os
+from importlib.metadata import entry_points
 from pathlib import Path
 
 # Add src directory to Python path
@@ -35,15 +37,56 @@ else:
     print(f"⚠ Warning: .env file not found at {env_file}")
 
 
+def registered_flows() -> dict:
+    """
+    Map flow names to their entry points in the `crewai_flows` group.
+    
+    Returns:
+        dict: Flow name to entry point, empty if the project isn't installed
+    """
+    return {ep.name: ep for ep in entry_points(group="crewai_flows")}
+
+
+def load_flow_module(flow_name: str):
+    """
+    Import a flow's main module, preferring its registered entry point.
+    
+    Args:
+        flow_name: Name of the flow (e.g. poem_flow)
+        
+    Returns:
+        module: The flow's main module
+    """
+    entry_point = registered_flows().get(flow_name)
+    if entry_point is not None:
+        return entry_point.load()
+    # Not installed (or not registered yet): import from src/ directly
+    return importlib.import_module(f"flows.{flow_name}.main")
+
+
+def flow_commands(flow_module) -> list[str]:
+    """List the public functions defined in a flow module."""
+    return [
+        name for name, value in vars(flow_module).items()
+        if not name.startswith("_")
+        and inspect.isfunction(value)
+        and value.__module__ == flow_module.__name__
+    ]
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python run_flow.py <flow_name> [command]")
         print("\nAvailable flows:")
+        flow_names = set(registered_flows())
         flows_dir = src_path / "flows"
         if flows_dir.exists():
-            for flow_dir in flows_dir.iterdir():
-                if flow_dir.is_dir() and not flow_dir.name.startswith("_"):
-                    print(f"  - {flow_dir.name}")
+            flow_names.update(
+                flow_dir.name for flow_dir in flows_dir.iterdir()
+                if flow_dir.is_dir() and not flow_dir.name.startswith("_")
+            )
+        for flow_name in sorted(flow_names):
+            print(f"  - {flow_name}")
         sys.exit(1)
     
     flow_name = sys.argv[1]
@@ -51,14 +94,13 @@ def main():
     
     # Import and run the flow
     try:
-        flow_module = __import__(f"flows.{flow_name}.main", fromlist=[""])
+        flow_module = load_flow_module(flow_name)
         
-        if hasattr(flow_module, command):
-            func = getattr(flow_module, command)
-            func()
+        if command in flow_commands(flow_module):
+            vars(flow_module)[command]()
         else:
             print(f"Error: Command '{command}' not found in {flow_name}")
-            print(f"Available commands: {[name for name in dir(flow_module) if not name.startswith('_') and callable(getattr(flow_module, name))]}")
+            print(f"Available commands: {flow_commands(flow_module)}")
             sys.exit(1)
             
     except ModuleNotFoundError as e:
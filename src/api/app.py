@@ -3,7 +3,9 @@ Main FastAPI application setup.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from .common import GZIP_MINIMUM_SIZE, ORJSONResponse
 from .poem_flow import router as poem_flow_router
 from .executions_router import router as executions_router
 
@@ -19,6 +21,7 @@ def create_app() -> FastAPI:
         title="CrewAI Multi-Flow API",
         description="REST API for executing and monitoring CrewAI flows",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
     
     # Add CORS middleware
@@ -30,6 +33,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Compress large JSON bodies (execution results are mostly prose).
+    # Event streams are left alone so each status update is flushed at once.
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+    
     # Register root-level routers
     app.include_router(executions_router, prefix="/api/v1", tags=["executions"])
     
@@ -1,23 +1,33 @@
 """
 Common models and utilities shared across all API flows.
 """
-from typing import Optional, Any
+from typing import Optional, Any, Union
 from datetime import datetime
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
-from .execution_store import ExecutionStatus
+from .execution_store import ExecutionRecord, ExecutionStatus
+
+
+# Responses smaller than this are sent uncompressed
+GZIP_MINIMUM_SIZE = 1024
+
+# Maximum length of the result preview shown in execution listings
+RESULT_PREVIEW_LENGTH = 100
 
 
 class ExecutionResponse(BaseModel):
     """Response model for flow execution initiation."""
-    execution_id: str = Field(..., description="Unique execution ID")
+    execution_id: str = Field(..., description="Unique execution ID (opaque URL-safe token)")
     status: ExecutionStatus = Field(..., description="Current execution status")
     message: str = Field(..., description="Human-readable message")
 
 
 class ExecutionStatusResponse(BaseModel):
     """Response model for execution status queries (generic for all flows)."""
-    execution_id: str = Field(..., description="Unique execution ID")
+    execution_id: str = Field(..., description="Unique execution ID (opaque URL-safe token)")
     flow_name: str = Field(..., description="Name of the flow")
     status: ExecutionStatus = Field(..., description="Current execution status")
     created_at: datetime = Field(..., description="When the execution was created")
@@ -25,3 +35,134 @@ class ExecutionStatusResponse(BaseModel):
     completed_at: Optional[datetime] = Field(None, description="When the execution completed")
     result: Optional[Any] = Field(None, description="Execution result (if completed), type depends on flow")
     error: Optional[str] = Field(None, description="Error message (if failed)")
+    version: int = Field(0, description="Incremented on every status change; also sent as the ETag")
+
+
+class ExecutionSummaryResponse(BaseModel):
+    """Lightweight response model for execution listings (generic for all flows)."""
+    execution_id: str = Field(..., description="Unique execution ID (opaque URL-safe token)")
+    flow_name: str = Field(..., description="Name of the flow")
+    status: ExecutionStatus = Field(..., description="Current execution status")
+    created_at: datetime = Field(..., description="When the execution was created")
+    completed_at: Optional[datetime] = Field(None, description="When the execution completed")
+    result_preview: Optional[str] = Field(
+        None,
+        description=f"First {RESULT_PREVIEW_LENGTH} characters of the result (if completed)"
+    )
+
+
+def make_result_preview(text: str) -> str:
+    """
+    Shorten a result text for execution listings.
+    
+    Args:
+        text: Full result text
+        
+    Returns:
+        str: At most RESULT_PREVIEW_LENGTH characters, plus "..." if cut
+    """
+    if len(text) <= RESULT_PREVIEW_LENGTH:
+        return text
+    return text[:RESULT_PREVIEW_LENGTH] + "..."
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    orjson natively encodes datetimes and enums in C, so handlers can return
+    plain dicts built from stored records without a Pydantic round-trip.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def to_status_payload(record: ExecutionRecord) -> dict:
+    """
+    Build the ExecutionStatusResponse payload for a stored execution record.
+    
+    The record is trusted, so the payload is assembled directly instead of
+    validating a response model, and the stored result JSON is embedded
+    as-is through `orjson.Fragment`.
+    
+    Args:
+        record: Stored execution record
+        
+    Returns:
+        dict: Payload for `orjson.dumps` / `ORJSONResponse`
+    """
+    result = None
+    if record.result_json is not None:
+        result = orjson.Fragment(record.result_json)
+    
+    return {
+        "execution_id": record.execution_id,
+        "flow_name": record.flow_name,
+        "status": record.status,
+        "created_at": record.created_at,
+        "started_at": record.started_at,
+        "completed_at": record.completed_at,
+        "result": result,
+        "error": record.error,
+        "version": record.version,
+    }
+
+
+def to_summary_payload(record: ExecutionRecord) -> dict:
+    """
+    Build the ExecutionSummaryResponse payload for a stored execution record.
+    
+    Args:
+        record: Stored execution record (its result need not be loaded)
+        
+    Returns:
+        dict: Payload for `orjson.dumps` / `ORJSONResponse`
+    """
+    return {
+        "execution_id": record.execution_id,
+        "flow_name": record.flow_name,
+        "status": record.status,
+        "created_at": record.created_at,
+        "completed_at": record.completed_at,
+        "result_preview": record.result_preview,
+    }
+
+
+def version_etag(version: Union[int, str]) -> str:
+    """
+    Build the weak ETag advertised for a store or record version.
+    
+    Args:
+        version: Record version, or store-wide version from `get_version`
+        
+    Returns:
+        str: ETag header value
+    """
+    return f'W/"{version}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Answer a conditional request whose `If-None-Match` matches `etag`.
+    
+    Uses the weak comparison required for `If-None-Match` and accepts lists
+    of tags as well as `*`. This is checked before any payload is built, so
+    an unchanged resource costs no serialization at all.
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        
+    Returns:
+        An empty `304 Not Modified` response, or None if the client's copy is stale
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    
+    opaque_tag = etag.removeprefix("W/")
+    tags = [tag.strip() for tag in header.split(",")]
+    if "*" in tags or any(tag.removeprefix("W/") == opaque_tag for tag in tags):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -1,12 +1,17 @@
 """
 Execution tracking and storage for flow executions.
-Stores execution results in-memory (can be extended to use persistent storage).
+Stores execution results in-memory by default, or in Redis when `REDIS_URL` is set.
 """
-import uuid
+import asyncio
+import os
+import secrets
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional, Any
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, computed_field
 
 
 class ExecutionStatus(str, Enum):
@@ -17,31 +22,143 @@ class ExecutionStatus(str, Enum):
     FAILED = "failed"
 
 
+def _from_ns(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    """Convert a `time.time_ns()` timestamp to a local datetime."""
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
+
+
 class ExecutionRecord(BaseModel):
-    """Record of a flow execution."""
+    """
+    Record of a flow execution.
+    
+    Timestamps are stored as `time.time_ns()` integers, which are cheap to
+    take and compare; the datetime views are derived on access, i.e. only
+    when a response is built. The result is kept as the JSON it will be sent
+    as, so reads never encode it again.
+    """
+    execution_id: str
+    flow_name: str
+    status: ExecutionStatus
+    created_at_ns: int
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
+    inputs: Dict[str, Any]
+    result_json: Optional[bytes] = None
+    result_preview: Optional[str] = None
+    error: Optional[str] = None
+    version: int = 0
+    
+    @computed_field
+    @property
+    def created_at(self) -> datetime:
+        return _from_ns(self.created_at_ns)
+    
+    @computed_field
+    @property
+    def started_at(self) -> Optional[datetime]:
+        return _from_ns(self.started_at_ns)
+    
+    @computed_field
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        return _from_ns(self.completed_at_ns)
+
+
+# Statuses after which an execution never changes again
+TERMINAL_STATUSES = (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED)
+
+
+@dataclass(slots=True)
+class _StoredRecord:
+    """Compact in-memory form of an ExecutionRecord (no per-instance dict)."""
     execution_id: str
     flow_name: str
     status: ExecutionStatus
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at_ns: int
     inputs: Dict[str, Any]
-    result: Optional[Any] = None
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
+    result_json: Optional[bytes] = None
+    result_preview: Optional[str] = None
     error: Optional[str] = None
+    version: int = 0
+    
+    def to_record(self, include_result: bool = True) -> ExecutionRecord:
+        """Expose the stored values as an ExecutionRecord, without re-validation."""
+        return ExecutionRecord.model_construct(
+            execution_id=self.execution_id,
+            flow_name=self.flow_name,
+            status=self.status,
+            created_at_ns=self.created_at_ns,
+            started_at_ns=self.started_at_ns,
+            completed_at_ns=self.completed_at_ns,
+            inputs=self.inputs,
+            result_json=self.result_json if include_result else None,
+            result_preview=self.result_preview,
+            error=self.error,
+            version=self.version
+        )
+
+
+def new_execution_id() -> str:
+    """
+    Generate a unique execution ID.
+    
+    Returns:
+        str: 22-character URL-safe token (128 random bits)
+    """
+    return secrets.token_urlsafe(16)
 
 
 class ExecutionStore:
     """
     In-memory store for flow execution records.
     
-    In production, this should be replaced with a persistent storage solution
-    (e.g., Redis, PostgreSQL, etc.)
+    Records live in the server process only, so this store is limited to a
+    single worker. Set `REDIS_URL` to use `RedisExecutionStore` instead when
+    state must be shared or survive restarts.
+    
+    Memory is bounded: beyond `max_records`, the oldest completed or failed
+    executions are evicted, as are those finished more than `ttl_seconds`
+    ago. Eviction runs as part of `create_execution`, the only operation that
+    grows the store.
+    
+    The store is single-writer by design: it must only be used from the
+    server's event loop (flows run elsewhere and report back through
+    coroutines on the loop), and no method awaits while the record and its
+    indices are being changed. Every mutation is therefore atomic with
+    respect to readers without any locking.
     """
     
-    def __init__(self):
-        self._executions: Dict[str, ExecutionRecord] = {}
+    def __init__(
+        self,
+        max_records: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Args:
+            max_records: Number of executions to keep (None for no limit)
+            ttl_seconds: How long finished executions are kept (None for no limit)
+        """
+        self._max_records = max_records
+        self._ttl_ns = int(ttl_seconds * 1e9) if ttl_seconds else None
+        
+        # Dicts keep insertion order, so `_executions` doubles as the
+        # chronological index; the secondary indices map to None as ordered sets
+        self._executions: Dict[str, _StoredRecord] = {}
+        self._by_flow: Dict[str, Dict[str, None]] = {}
+        self._by_status: Dict[ExecutionStatus, Dict[str, None]] = {
+            status: {} for status in ExecutionStatus
+        }
+        self._events: Dict[str, asyncio.Event] = {}
+        # Versions restart at 0 with every store; the random epoch keeps a
+        # version seen by a client before a restart from matching a new one
+        self._epoch = new_execution_id()
+        self._version = 0
     
-    def create_execution(
+    async def create_execution(
         self,
         flow_name: str,
         inputs: Dict[str, Any]
@@ -56,18 +173,23 @@ class ExecutionStore:
         Returns:
             str: Unique execution ID
         """
-        execution_id = str(uuid.uuid4())
-        record = ExecutionRecord(
+        execution_id = new_execution_id()
+        record = _StoredRecord(
             execution_id=execution_id,
             flow_name=flow_name,
             status=ExecutionStatus.PENDING,
-            created_at=datetime.now(),
+            created_at_ns=time.time_ns(),
             inputs=inputs
         )
+        self._evict(record.created_at_ns)
         self._executions[execution_id] = record
+        self._by_flow.setdefault(flow_name, {})[execution_id] = None
+        self._by_status[record.status][execution_id] = None
+        self._events[execution_id] = asyncio.Event()
+        self._version += 1
         return execution_id
     
-    def get_execution(self, execution_id: str) -> Optional[ExecutionRecord]:
+    async def get_execution(self, execution_id: str) -> Optional[ExecutionRecord]:
         """
         Get an execution record by ID.
         
@@ -77,14 +199,99 @@ class ExecutionStore:
         Returns:
             ExecutionRecord if found, None otherwise
         """
-        return self._executions.get(execution_id)
+        record = self._executions.get(execution_id)
+        return record.to_record() if record else None
+    
+    async def get_version(self) -> str:
+        """
+        Get the store-wide version, changed on every create or update.
+        
+        Returns:
+            str: Current version, unique to this store instance
+        """
+        return f"{self._epoch}-{self._version}"
+    
+    async def wait_for_update(
+        self,
+        execution_id: str,
+        last_status: Optional[ExecutionStatus] = None,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until an execution's status differs from the last one seen.
+        
+        Args:
+            execution_id: The execution ID
+            last_status: Status the caller has already observed
+            timeout: Maximum time to wait in seconds (None waits forever)
+            
+        Returns:
+            True if the status changed, False on timeout or unknown ID
+        """
+        # Grab the event before checking the record so an update landing in
+        # between is never missed: it sets exactly the event we wait on.
+        event = self._events.get(execution_id)
+        record = self._executions.get(execution_id)
+        if event is None or record is None:
+            return False
+        if record.status != last_status:
+            return True
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    
+    def _notify(self, execution_id: str):
+        """Wake up everyone waiting on an execution and arm a fresh event."""
+        event = self._events.get(execution_id)
+        if event is None:
+            return
+        self._events[execution_id] = asyncio.Event()
+        event.set()
+    
+    def _evict(self, now_ns: int):
+        """
+        Drop finished executions that are expired or over the size limit.
+        
+        Args:
+            now_ns: Current time as returned by `time.time_ns()`
+        """
+        excess = 0
+        if self._max_records:
+            # Make room for the record about to be inserted
+            excess = len(self._executions) + 1 - self._max_records
+        cutoff_ns = now_ns - self._ttl_ns if self._ttl_ns else None
+        
+        evicted = []
+        # Oldest first; nothing created after the cutoff can have finished before it
+        for execution_id, record in self._executions.items():
+            if excess <= 0 and (cutoff_ns is None or record.created_at_ns >= cutoff_ns):
+                break
+            if record.status not in TERMINAL_STATUSES:
+                continue
+            if excess > 0 or record.completed_at_ns < cutoff_ns:
+                evicted.append(execution_id)
+                excess -= 1
+        
+        for execution_id in evicted:
+            record = self._executions.pop(execution_id)
+            flow_index = self._by_flow[record.flow_name]
+            flow_index.pop(execution_id)
+            if not flow_index:
+                del self._by_flow[record.flow_name]
+            self._by_status[record.status].pop(execution_id)
+            # Wake up any stream still watching so it can see the record is gone
+            self._events.pop(execution_id).set()
     
-    def update_status(
+    async def update_status(
         self,
         execution_id: str,
         status: ExecutionStatus,
         result: Optional[Any] = None,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        result_preview: Optional[str] = None,
+        result_json: Optional[bytes] = None
     ):
         """
         Update the status of an execution.
@@ -94,53 +301,119 @@ class ExecutionStore:
             status: New status
             result: Execution result (for completed status)
             error: Error message (for failed status)
+            result_preview: Short text summary of the result, shown in listings
+            result_json: Result already encoded as JSON; used instead of result
         """
         record = self._executions.get(execution_id)
         if not record:
             return
         
+        if record.status != status:
+            self._by_status[record.status].pop(execution_id, None)
+            self._by_status[status][execution_id] = None
+        
+        now_ns = time.time_ns()
         record.status = status
+        record.version += 1
+        self._version += 1
         
-        if status == ExecutionStatus.RUNNING and record.started_at is None:
-            record.started_at = datetime.now()
+        if status == ExecutionStatus.RUNNING and record.started_at_ns is None:
+            record.started_at_ns = now_ns
         
-        if status in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
-            record.completed_at = datetime.now()
-            if result is not None:
-                record.result = result
+        if status in TERMINAL_STATUSES:
+            record.completed_at_ns = now_ns
+            if result_json is not None:
+                record.result_json = result_json
+            elif result is not None:
+                record.result_json = orjson.dumps(result)
+            if result_preview is not None:
+                record.result_preview = result_preview
             if error is not None:
                 record.error = error
+        
+        self._notify(execution_id)
     
-    def list_executions(
+    async def list_executions(
         self,
         flow_name: Optional[str] = None,
         status: Optional[ExecutionStatus] = None,
-        limit: int = 100
+        limit: int = 100,
+        include_result: bool = True
     ) -> list[ExecutionRecord]:
         """
-        List execution records with optional filters.
+        List execution records with optional filters, newest first.
         
         Args:
             flow_name: Filter by flow name
             status: Filter by status
             limit: Maximum number of records to return
+            include_result: Whether to load `result_json` (only the preview otherwise)
             
         Returns:
             List of execution records
         """
-        executions = list(self._executions.values())
+        if limit <= 0:
+            return []
         
-        if flow_name:
-            executions = [e for e in executions if e.flow_name == flow_name]
+        candidates = self._by_flow.get(flow_name, {}) if flow_name else self._executions
+        # Newest first: walk the creation-ordered index backwards
+        execution_ids = reversed(candidates)
         
         if status:
-            executions = [e for e in executions if e.status == status]
+            bucket = self._by_status[status]
+            # A filtered walk visits about limit * len(candidates) / len(bucket)
+            # records before it fills up. Only a rare status is cheaper to
+            # drive from its index, which is ordered by status change rather
+            # than creation and so has to be sorted first
+            if len(bucket) <= max(limit, len(candidates) // limit):
+                execution_ids = sorted(
+                    bucket,
+                    key=lambda execution_id: self._executions[execution_id].created_at_ns,
+                    reverse=True
+                )
         
-        # Sort by created_at descending
-        executions.sort(key=lambda e: e.created_at, reverse=True)
+        executions = []
+        for execution_id in execution_ids:
+            record = self._executions[execution_id]
+            if flow_name and record.flow_name != flow_name:
+                continue
+            if status and record.status != status:
+                continue
+            executions.append(record.to_record(include_result))
+            if len(executions) == limit:
+                break
         
-        return executions[:limit]
+        return executions
+
+
+def create_execution_store():
+    """
+    Create the execution store configured for this process.
+    
+    Uses Redis when the `REDIS_URL` environment variable is set (required to
+    run the API with multiple workers), and the in-memory store otherwise,
+    bounded by `EXECUTION_STORE_MAX_RECORDS` (default: 10000, 0 for no limit)
+    and `EXECUTION_STORE_TTL_SECONDS` (default: 0, keep until evicted by size).
+    
+    Returns:
+        ExecutionStore or RedisExecutionStore instance
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        return ExecutionStore(
+            max_records=int(os.getenv("EXECUTION_STORE_MAX_RECORDS", "10000")) or None,
+            ttl_seconds=float(os.getenv("EXECUTION_STORE_TTL_SECONDS", "0")) or None
+        )
+    
+    try:
+        from .redis_execution_store import RedisExecutionStore
+    except ImportError as e:
+        raise ImportError(
+            "REDIS_URL is set but the redis package is not installed. "
+            "Install it with: pip install 'crewmaster[redis]'"
+        ) from e
+    return RedisExecutionStore(redis_url)
 
 
 # Global execution store instance
-execution_store = ExecutionStore()
+execution_store = create_execution_store()
@@ -1,53 +1,111 @@
 """
 Root-level API router for execution management across all flows.
 """
-from typing import Optional
-from fastapi import APIRouter
+import gzip
+from typing import Optional, Union
+import orjson
+from fastapi import APIRouter, Request, Response
 
-from .common import ExecutionStatusResponse
+from .common import (
+    GZIP_MINIMUM_SIZE,
+    ExecutionStatusResponse,
+    ExecutionSummaryResponse,
+    not_modified,
+    to_status_payload,
+    to_summary_payload,
+    version_etag
+)
 from .execution_store import execution_store, ExecutionStatus
 
 
 router = APIRouter()
 
+# Serialized list responses keyed by query (plus "gzip" for the compressed
+# variant), valid for a single store version
+_list_cache: dict[tuple, bytes] = {}
+_list_cache_version: Optional[str] = None
 
-@router.get("/executions", response_model=list[ExecutionStatusResponse])
+# Distinct queries kept per version before the cache is reset
+LIST_CACHE_MAX_ENTRIES = 128
+
+
+@router.get(
+    "/executions",
+    response_model=Union[list[ExecutionSummaryResponse], list[ExecutionStatusResponse]],
+    responses={304: {"description": "No execution changed since the given ETag"}}
+)
 async def list_executions(
+    request: Request,
     flow_name: Optional[str] = None,
     status: Optional[ExecutionStatus] = None,
-    limit: int = 100
+    limit: int = 100,
+    include_result: bool = False
 ):
     """
     List all executions across all flows with optional filtering.
     
+    By default each execution is summarized with a short `result_preview`;
+    pass `include_result=true` to get full ExecutionStatusResponse records.
+    
+    Responses are cached until the next execution is created or updated, and
+    carry an `ETag`; sending it back in `If-None-Match` returns
+    `304 Not Modified` while nothing changed. Large responses are cached
+    gzip-compressed too, so each body is compressed once per version rather
+    than once per request.
+    
     Args:
+        request: Incoming request (for conditional headers)
         flow_name: Filter by specific flow name (optional)
         status: Filter by execution status (optional)
         limit: Maximum number of records to return (default: 100)
+        include_result: Return full records including results (default: false)
         
     Returns:
         List of execution records
     """
-    records = execution_store.list_executions(
-        flow_name=flow_name,
-        status=status,
-        limit=limit
-    )
+    global _list_cache_version
     
-    # Convert to response models
-    responses = []
-    for record in records:
-        responses.append(
-            ExecutionStatusResponse(
-                execution_id=record.execution_id,
-                flow_name=record.flow_name,
-                status=record.status,
-                created_at=record.created_at,
-                started_at=record.started_at,
-                completed_at=record.completed_at,
-                result=record.result,
-                error=record.error
-            )
+    version = await execution_store.get_version()
+    etag = version_etag(version)
+    if unchanged := not_modified(request, etag):
+        return unchanged
+    
+    if version != _list_cache_version or len(_list_cache) >= LIST_CACHE_MAX_ENTRIES:
+        _list_cache.clear()
+        _list_cache_version = version
+    
+    key = (flow_name, status, limit, include_result)
+    body = _list_cache.get(key)
+    if body is None:
+        records = await execution_store.list_executions(
+            flow_name=flow_name,
+            status=status,
+            limit=limit,
+            include_result=include_result
         )
+        
+        # Stored records are already validated, so dump them straight to
+        # JSON instead of building (and re-validating) response models
+        to_payload = to_status_payload if include_result else to_summary_payload
+        body = orjson.dumps([to_payload(record) for record in records])
+        # Skip caching if another request already moved the cache to a newer version
+        if _list_cache_version == version:
+            _list_cache[key] = body
     
-    return responses
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if len(body) >= GZIP_MINIMUM_SIZE and "gzip" in request.headers.get("accept-encoding", ""):
+        gzip_key = key + ("gzip",)
+        compressed = _list_cache.get(gzip_key)
+        if compressed is None:
+            compressed = gzip.compress(body)
+            if _list_cache_version == version:
+                _list_cache[gzip_key] = compressed
+        # GZipMiddleware passes responses with a Content-Encoding through untouched
+        body = compressed
+        headers["Content-Encoding"] = "gzip"
+    
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers
+    )
@@ -3,64 +3,158 @@ API router for poem_flow endpoints.
 Handles flow execution and status retrieval without coupling the flow to FastAPI.
 """
 import asyncio
+import logging
+import multiprocessing
+import os
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from typing import Optional
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import (
+    APIRouter,
+    FastAPI,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect
+)
+from fastapi.responses import StreamingResponse
 
-from .models import (
-    PoemFlowRequest,
-    PoemResult
+from .models import PoemFlowRequest
+from ..common import (
+    ExecutionResponse,
+    ExecutionStatusResponse,
+    ORJSONResponse,
+    make_result_preview,
+    not_modified,
+    to_status_payload,
+    version_etag
 )
-from ..common import ExecutionResponse, ExecutionStatusResponse
 from ..execution_store import (
     execution_store,
     ExecutionStatus
 )
 
-# Import the flow - note that the flow itself has no FastAPI dependencies
-from flows.poem_flow.main import PoemFlow
+# Pool entry points live with the flow, in a module without import-time side
+# effects, so worker processes never import (and re-run) this router
+from flows.poem_flow.worker import init_worker, run_poem_flow, warm_up_worker
+
+
+logger = logging.getLogger(__name__)
+
+# Interval at which an idle event stream sends a comment line, so proxies
+# and clients don't drop the connection while a long flow is running
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+# WebSocket close code (application range) for an unknown execution ID
+WS_CLOSE_NOT_FOUND = 4404
+
+# Maximum number of poem flows running at the same time
+MAX_WORKERS = int(os.getenv("POEM_FLOW_MAX_WORKERS", "0")) or os.cpu_count() or 1
+
+
+async def _report_warm_up(futures: list[asyncio.Future]):
+    """Log if the workers could not load the flow at startup."""
+    results = await asyncio.gather(*futures, return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.error(
+            "Poem flow workers failed to load the flow; executions will fail",
+            exc_info=errors[0]
+        )
+
+
+def _create_executor() -> ProcessPoolExecutor:
+    """Create the worker pool that runs flow kickoffs."""
+    # Spawn (rather than fork) workers: the server process already runs an
+    # event loop and threads that must not be duplicated into children
+    return ProcessPoolExecutor(
+        max_workers=MAX_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker
+    )
+
+
+# Flows run in separate processes so long, blocking LLM calls never compete
+# with request handlers for the server's threadpool or the GIL. Created by
+# the lifespan, so importing this module never starts a pool.
+EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Start the worker pool with the app and stop it on shutdown."""
+    global EXECUTOR
+    EXECUTOR = _create_executor()
+    
+    # Each submit on an idle pool spawns a worker, so the first executions
+    # don't pay for process start-up and flow imports
+    loop = asyncio.get_running_loop()
+    warm_up = asyncio.create_task(_report_warm_up([
+        loop.run_in_executor(EXECUTOR, warm_up_worker)
+        for _ in range(MAX_WORKERS)
+    ]))
+    yield
+    warm_up.cancel()
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    EXECUTOR = None
+
 
+router = APIRouter(default_response_class=ORJSONResponse, lifespan=_lifespan)
 
-router = APIRouter()
+# Strong references to in-flight executions so they aren't garbage collected
+_running_executions: set[asyncio.Task] = set()
 
+# One slot per pool worker: executions wait here, still pending, until a
+# worker is free to run them
+_worker_slots = asyncio.Semaphore(MAX_WORKERS)
 
-def execute_flow(execution_id: str, sentence_count: Optional[int] = None):
+
+async def execute_flow(execution_id: str, sentence_count: Optional[int] = None):
     """
-    Execute the poem flow in a background task.
+    Execute the poem flow on the worker pool and track its status.
+    
+    Runs on the event loop; only the flow itself is shipped to a worker
+    process, so all execution store updates happen in the server process.
+    The execution stays pending until a worker is free to start it.
     
     Args:
         execution_id: The execution ID to track
         sentence_count: Optional sentence count override
     """
+    global EXECUTOR
+    
     try:
-        # Update status to running
-        execution_store.update_status(execution_id, ExecutionStatus.RUNNING)
-        
-        # Create and execute the flow
-        flow = PoemFlow()
-        
-        # Override sentence count if provided
-        if sentence_count is not None:
-            flow.state.sentence_count = sentence_count
-        
-        # Execute the flow
-        flow.kickoff()
-        
-        # Extract results from the flow state
-        result = PoemResult(
-            sentence_count=flow.state.sentence_count,
-            poem=flow.state.poem
-        )
+        async with _worker_slots:
+            executor = EXECUTOR
+            if executor is None:
+                raise RuntimeError("Poem flow worker pool is not running")
+            
+            # Update status to running
+            await execution_store.update_status(execution_id, ExecutionStatus.RUNNING)
+            
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(executor, run_poem_flow, sentence_count)
         
         # Update status to completed
-        execution_store.update_status(
+        await execution_store.update_status(
             execution_id,
             ExecutionStatus.COMPLETED,
-            result=result.model_dump()
+            result_json=orjson.dumps(result),
+            result_preview=make_result_preview(result["poem"])
         )
         
     except Exception as e:
+        # A crashed worker leaves the pool unusable; replace it so later
+        # executions can still run. Every execution on the broken pool fails
+        # at once, so only the first one to get here swaps it out.
+        if isinstance(e, BrokenProcessPool) and EXECUTOR is executor:
+            EXECUTOR = _create_executor()
+            executor.shutdown(wait=False)
+        
         # Update status to failed
-        execution_store.update_status(
+        await execution_store.update_status(
             execution_id,
             ExecutionStatus.FAILED,
             error=str(e)
@@ -68,50 +162,56 @@ def execute_flow(execution_id: str, sentence_count: Optional[int] = None):
 
 
 @router.post("/execute", response_model=ExecutionResponse)
-async def trigger_poem_flow(
-    request: PoemFlowRequest,
-    background_tasks: BackgroundTasks
-):
+async def trigger_poem_flow(request: PoemFlowRequest):
     """
     Trigger a poem flow execution.
     
-    The flow will execute asynchronously in the background.
+    The flow will execute asynchronously on a worker process.
     Use the returned execution_id to check status and retrieve results.
     
     Args:
         request: Flow execution parameters
-        background_tasks: FastAPI background tasks
         
     Returns:
         ExecutionResponse with execution_id and initial status
     """
     # Create execution record
-    execution_id = execution_store.create_execution(
+    execution_id = await execution_store.create_execution(
         flow_name="poem_flow",
         inputs=request.model_dump()
     )
     
     # Schedule flow execution in background
-    background_tasks.add_task(
-        execute_flow,
-        execution_id,
-        request.sentence_count
+    task = asyncio.create_task(
+        execute_flow(execution_id, request.sentence_count)
     )
+    _running_executions.add(task)
+    task.add_done_callback(_running_executions.discard)
     
-    return ExecutionResponse(
-        execution_id=execution_id,
-        status=ExecutionStatus.PENDING,
-        message=f"Poem flow execution initiated with ID: {execution_id}"
-    )
+    # Fixed shape built from trusted values: skip response model validation
+    return ORJSONResponse({
+        "execution_id": execution_id,
+        "status": ExecutionStatus.PENDING,
+        "message": f"Poem flow execution initiated with ID: {execution_id}"
+    })
 
 
-@router.get("/execution/{execution_id}", response_model=ExecutionStatusResponse)
-async def get_execution_status(execution_id: str):
+@router.get(
+    "/execution/{execution_id}",
+    response_model=ExecutionStatusResponse,
+    responses={304: {"description": "Status unchanged since the given ETag"}}
+)
+async def get_execution_status(execution_id: str, request: Request):
     """
     Get the status and results of a flow execution.
     
+    Clients that poll should send back the last `ETag` in `If-None-Match`;
+    while the status is unchanged the server answers `304 Not Modified`
+    with an empty body.
+    
     Args:
         execution_id: The execution ID
+        request: Incoming request (for conditional headers)
         
     Returns:
         ExecutionStatusResponse with current status and results (if completed)
@@ -119,7 +219,7 @@ async def get_execution_status(execution_id: str):
     Raises:
         HTTPException: If execution_id is not found
     """
-    record = execution_store.get_execution(execution_id)
+    record = await execution_store.get_execution(execution_id)
     
     if not record:
         raise HTTPException(
@@ -127,18 +227,125 @@ async def get_execution_status(execution_id: str):
             detail=f"Execution {execution_id} not found"
         )
     
-    # Convert result dict back to PoemResult if available
-    result = None
-    if record.result:
-        result = PoemResult(**record.result)
-    
-    return ExecutionStatusResponse(
-        execution_id=record.execution_id,
-        flow_name=record.flow_name,
-        status=record.status,
-        created_at=record.created_at,
-        started_at=record.started_at,
-        completed_at=record.completed_at,
-        result=result,
-        error=record.error
+    etag = version_etag(record.version)
+    if unchanged := not_modified(request, etag):
+        return unchanged
+    
+    # Returning the response directly skips response_model validation; the
+    # model still documents the payload
+    return ORJSONResponse(to_status_payload(record), headers={"ETag": etag})
+
+
+@router.get("/execution/{execution_id}/stream")
+async def stream_execution_status(execution_id: str):
+    """
+    Stream status changes of a flow execution as Server-Sent Events.
+    
+    Emits one `data:` frame with an ExecutionStatusResponse payload for the
+    current status and for every subsequent change, then closes the stream
+    once the execution has completed or failed.
+    
+    Args:
+        execution_id: The execution ID
+        
+    Returns:
+        StreamingResponse with `text/event-stream` content
+        
+    Raises:
+        HTTPException: If execution_id is not found
+    """
+    if not await execution_store.get_execution(execution_id):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Execution {execution_id} not found"
+        )
+    
+    async def event_stream():
+        last_status = None
+        while True:
+            changed = await execution_store.wait_for_update(
+                execution_id,
+                last_status,
+                timeout=STREAM_KEEPALIVE_SECONDS
+            )
+            record = await execution_store.get_execution(execution_id)
+            if not record:
+                break
+            if not changed:
+                yield b": keepalive\n\n"
+                continue
+            
+            last_status = record.status
+            yield b"data: " + orjson.dumps(to_status_payload(record)) + b"\n\n"
+            
+            if record.status in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
+                break
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
     )
+
+
+@router.websocket("/ws/{execution_id}")
+async def watch_execution(websocket: WebSocket, execution_id: str):
+    """
+    Send the final status of a flow execution over a WebSocket.
+    
+    The connection stays idle until the execution has completed or failed,
+    then receives a single ExecutionStatusResponse payload and is closed.
+    Unknown execution IDs are closed with code 4404.
+    
+    Args:
+        websocket: The client connection
+        execution_id: The execution ID
+    """
+    await websocket.accept()
+    
+    # Keep a receive pending while waiting: it is the only way to notice a
+    # client that goes away before the execution finishes
+    receive = asyncio.ensure_future(websocket.receive())
+    try:
+        record = await execution_store.get_execution(execution_id)
+        while record and record.status not in (
+            ExecutionStatus.COMPLETED,
+            ExecutionStatus.FAILED
+        ):
+            # The timeout only bounds how long a vanished record goes unnoticed
+            update = asyncio.ensure_future(execution_store.wait_for_update(
+                execution_id,
+                record.status,
+                timeout=STREAM_KEEPALIVE_SECONDS
+            ))
+            done, _ = await asyncio.wait(
+                {update, receive},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            
+            if receive in done:
+                if receive.result()["type"] == "websocket.disconnect":
+                    update.cancel()
+                    return
+                # Ignore anything the client sends and keep listening
+                receive = asyncio.ensure_future(websocket.receive())
+            if update not in done:
+                update.cancel()
+                continue
+            
+            update.result()
+            record = await execution_store.get_execution(execution_id)
+        
+        if not record:
+            await websocket.close(
+                code=WS_CLOSE_NOT_FOUND,
+                reason=f"Execution {execution_id} not found"
+            )
+            return
+        
+        await websocket.send_text(orjson.dumps(to_status_payload(record)).decode())
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receive.cancel()
@@ -0,0 +1,300 @@
+"""
+Redis-backed storage for flow executions.
+Shares execution records between server processes so the API can run with
+multiple workers, and keeps them across restarts.
+
+Layout:
+    exec:{id}                       hash with one JSON-encoded value per record field
+    exec_index                      sorted set of all execution IDs, scored by creation time
+    exec_index:by_flow:{flow_name}  sorted set of a flow's execution IDs, same scores
+    exec_version                    counter incremented on every create or update
+    exec_epoch                      random token identifying this exec_version counter
+    status:{id}                     pub/sub channel announcing status changes
+"""
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Any
+
+import orjson
+import redis.asyncio as redis
+
+from .execution_store import ExecutionRecord, ExecutionStatus, new_execution_id
+
+
+INDEX_KEY = "exec_index"
+VERSION_KEY = "exec_version"
+EPOCH_KEY = "exec_epoch"
+
+# Number of IDs fetched per round trip while filtering `list_executions` by status
+LIST_BATCH_SIZE = 100
+
+
+def _record_key(execution_id: str) -> str:
+    return f"exec:{execution_id}"
+
+
+def _flow_index_key(flow_name: str) -> str:
+    return f"{INDEX_KEY}:by_flow:{flow_name}"
+
+
+def _status_channel(execution_id: str) -> str:
+    return f"status:{execution_id}"
+
+
+# Stored record fields (the computed datetime views are derived on read)
+_RECORD_FIELDS = set(ExecutionRecord.model_fields)
+
+# Fields loaded when listing without results
+_SUMMARY_FIELDS = sorted(_RECORD_FIELDS - {"result_json"})
+
+
+def _encode(fields: Dict[str, Any]) -> Dict[str, str]:
+    """Encode record fields as hash values, skipping unset ones."""
+    return {name: json.dumps(value) for name, value in fields.items() if value is not None}
+
+
+def _decode(data: Dict[str, str]) -> ExecutionRecord:
+    """Rebuild an execution record from its hash values."""
+    return ExecutionRecord.model_validate(
+        {name: json.loads(value) for name, value in data.items()}
+    )
+
+
+class RedisExecutionStore:
+    """
+    Redis store for flow execution records.
+    
+    Exposes the same interface as the in-memory `ExecutionStore`.
+    """
+    
+    def __init__(self, url: str):
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+        self._epoch: Optional[str] = None
+    
+    async def create_execution(
+        self,
+        flow_name: str,
+        inputs: Dict[str, Any]
+    ) -> str:
+        """
+        Create a new execution record.
+        
+        Args:
+            flow_name: Name of the flow being executed
+            inputs: Input parameters for the flow
+            
+        Returns:
+            str: Unique execution ID
+        """
+        execution_id = new_execution_id()
+        record = ExecutionRecord(
+            execution_id=execution_id,
+            flow_name=flow_name,
+            status=ExecutionStatus.PENDING,
+            created_at_ns=time.time_ns(),
+            inputs=inputs
+        )
+        score = record.created_at_ns
+        
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(_record_key(execution_id), mapping=_encode(record.model_dump(mode="json", include=_RECORD_FIELDS)))
+            pipe.zadd(INDEX_KEY, {execution_id: score})
+            pipe.zadd(_flow_index_key(flow_name), {execution_id: score})
+            pipe.incr(VERSION_KEY)
+            await pipe.execute()
+        
+        return execution_id
+    
+    async def get_execution(self, execution_id: str) -> Optional[ExecutionRecord]:
+        """
+        Get an execution record by ID.
+        
+        Args:
+            execution_id: The execution ID
+            
+        Returns:
+            ExecutionRecord if found, None otherwise
+        """
+        data = await self._redis.hgetall(_record_key(execution_id))
+        return _decode(data) if data else None
+    
+    async def get_version(self) -> str:
+        """
+        Get the store-wide version, changed on every create or update.
+        
+        Returns:
+            str: Current version, unique to this Redis database
+        """
+        version = await self._redis.get(VERSION_KEY)
+        # A missing counter means a new or flushed database, whose epoch may
+        # have been (re)created since it was cached
+        if self._epoch is None or version is None:
+            self._epoch = await self._load_epoch()
+        return f"{self._epoch}-{int(version or 0)}"
+    
+    async def _load_epoch(self) -> str:
+        """
+        Get the epoch of the version counter, creating it on first use.
+        
+        The counter restarts if the database is flushed; so does the epoch,
+        which keeps a version from before the flush from matching a new one.
+        
+        Returns:
+            str: Epoch shared by every process using this database
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(EPOCH_KEY, new_execution_id(), nx=True)
+            pipe.get(EPOCH_KEY)
+            _, epoch = await pipe.execute()
+        return epoch
+    
+    async def wait_for_update(
+        self,
+        execution_id: str,
+        last_status: Optional[ExecutionStatus] = None,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until an execution's status differs from the last one seen.
+        
+        Args:
+            execution_id: The execution ID
+            last_status: Status the caller has already observed
+            timeout: Maximum time to wait in seconds (None waits forever)
+            
+        Returns:
+            True if the status changed, False on timeout or unknown ID
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        
+        pubsub = self._redis.pubsub()
+        try:
+            # Subscribe before reading the record so an update landing in
+            # between is still delivered on the channel
+            await pubsub.subscribe(_status_channel(execution_id))
+            
+            status = await self._redis.hget(_record_key(execution_id), "status")
+            if status is None:
+                return False
+            if ExecutionStatus(json.loads(status)) != last_status:
+                return True
+            
+            while True:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=remaining
+                )
+                if message is not None:
+                    return True
+        finally:
+            await pubsub.aclose()
+    
+    async def update_status(
+        self,
+        execution_id: str,
+        status: ExecutionStatus,
+        result: Optional[Any] = None,
+        error: Optional[str] = None,
+        result_preview: Optional[str] = None,
+        result_json: Optional[bytes] = None
+    ):
+        """
+        Update the status of an execution.
+        
+        Args:
+            execution_id: The execution ID
+            status: New status
+            result: Execution result (for completed status)
+            error: Error message (for failed status)
+            result_preview: Short text summary of the result, shown in listings
+            result_json: Result already encoded as JSON; used instead of result
+        """
+        key = _record_key(execution_id)
+        now_ns = time.time_ns()
+        fields = {"status": status.value}
+        
+        if status in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
+            fields.update(completed_at_ns=now_ns, error=error, result_preview=result_preview)
+            if result_json is None and result is not None:
+                result_json = orjson.dumps(result)
+            if result_json is not None:
+                fields["result_json"] = result_json.decode()
+        
+        async def apply(pipe):
+            # Check and write under WATCH so a record removed concurrently is
+            # not resurrected as a partial hash (redis-py retries on conflict)
+            if not await pipe.exists(key):
+                return
+            pipe.multi()
+            pipe.hset(key, mapping=_encode(fields))
+            pipe.hincrby(key, "version", 1)
+            if status == ExecutionStatus.RUNNING:
+                pipe.hsetnx(key, "started_at_ns", now_ns)
+            pipe.incr(VERSION_KEY)
+            pipe.publish(_status_channel(execution_id), status.value)
+        
+        await self._redis.transaction(apply, key)
+    
+    async def list_executions(
+        self,
+        flow_name: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        limit: int = 100,
+        include_result: bool = True
+    ) -> list[ExecutionRecord]:
+        """
+        List execution records with optional filters, newest first.
+        
+        Args:
+            flow_name: Filter by flow name
+            status: Filter by status
+            limit: Maximum number of records to return
+            include_result: Whether to load `result_json` (only the preview otherwise)
+            
+        Returns:
+            List of execution records
+        """
+        if limit <= 0:
+            return []
+        
+        index = _flow_index_key(flow_name) if flow_name else INDEX_KEY
+        # Without a status filter every fetched ID is returned, so one page is enough
+        batch_size = max(limit, LIST_BATCH_SIZE) if status else limit
+        
+        executions: list[ExecutionRecord] = []
+        start = 0
+        while len(executions) < limit:
+            execution_ids = await self._redis.zrevrange(index, start, start + batch_size - 1)
+            if not execution_ids:
+                break
+            
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for execution_id in execution_ids:
+                    if include_result:
+                        pipe.hgetall(_record_key(execution_id))
+                    else:
+                        # Leave the (potentially large) result on the server
+                        pipe.hmget(_record_key(execution_id), _SUMMARY_FIELDS)
+                rows = await pipe.execute()
+            
+            if not include_result:
+                rows = [
+                    {name: value for name, value in zip(_SUMMARY_FIELDS, values) if value is not None}
+                    for values in rows
+                ]
+            
+            for data in rows:
+                if not data:
+                    continue
+                record = _decode(data)
+                if status is None or record.status == status:
+                    executions.append(record)
+            
+            start += batch_size
+        
+        return executions[:limit]
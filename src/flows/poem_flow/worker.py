@@ -0,0 +1,68 @@
+"""
+Process pool entry points for running the poem flow.
+
+Worker processes import this module to unpickle the functions below, so it
+must stay free of import-time side effects: no FastAPI, no execution store
+and no process pool of its own.
+"""
+import functools
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=1)
+def _get_poem_flow_cls():
+    """
+    Import the flow class on first use.
+
+    Importing the flow loads the CrewAI/LLM stack, which only the worker
+    processes need.
+
+    Returns:
+        type: The PoemFlow class
+    """
+    from .main import PoemFlow
+    return PoemFlow
+
+
+def init_worker():
+    """Load the flow and its CrewAI/LLM stack once per worker process."""
+    try:
+        _get_poem_flow_cls()
+    except Exception:
+        # An initializer error kills the worker and breaks the whole pool;
+        # the import is retried (and its real error raised) per execution
+        pass
+
+
+def warm_up_worker():
+    """Task submitted at startup so worker processes start right away."""
+    # Cached by the initializer; raises the flow's import error otherwise
+    _get_poem_flow_cls()
+
+
+def run_poem_flow(sentence_count: Optional[int] = None) -> dict:
+    """
+    Run the poem flow to completion inside a worker process.
+
+    Args:
+        sentence_count: Optional sentence count override
+
+    Returns:
+        dict: The PoemResult fields (sentence_count, poem)
+    """
+    # Create and execute the flow
+    flow = _get_poem_flow_cls()()
+
+    # Override sentence count if provided
+    if sentence_count is not None:
+        flow.state.sentence_count = sentence_count
+
+    # Execute the flow
+    flow.kickoff()
+
+    # Extract results from the flow state. The shape is fixed, so build the
+    # PoemResult dict directly rather than validating and dumping a model
+    return {
+        "sentence_count": flow.state.sentence_count,
+        "poem": flow.state.poem
+    }